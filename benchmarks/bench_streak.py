@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Benchmarks for the streak hot paths, using synthetic data and no network
+
+    python3 benchmarks/bench_streak.py --output before.json
+    python3 benchmarks/bench_streak.py --compare before.json
+
+Results are printed (or written) as JSON so runs from different commits can
+be compared; --compare prints the change against an earlier result file.
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+from streak_core import DayWindows, StreakProfile, StreakTracker
+
+class FakeResponse:
+    """Just enough of requests.Response for check_github_activity"""
+
+    def __init__(self, body, next_url=None):
+        self.status_code = 200
+        self.headers = {'ETag': '"bench"', 'X-RateLimit-Limit': '5000',
+                        'X-RateLimit-Remaining': '4999', 'X-RateLimit-Reset': '0'}
+        self.links = {'next': {'url': next_url}} if next_url else {}
+        self.content = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+class FakeSession:
+    """Serves pre-built event pages; page n links to page n + 1"""
+
+    def __init__(self, pages):
+        self.pages = [json.dumps(page).encode('utf-8') for page in pages]
+
+    def get(self, url, headers=None, timeout=None):
+        page = int(url.rpartition('bench_page=')[2]) if 'bench_page=' in url else 0
+        next_url = f"https://bench.invalid/events?bench_page={page + 1}" if page + 1 < len(self.pages) else None
+        return FakeResponse(self.pages[page], next_url)
+
+def make_payload(i):
+    """A push payload the size of a busy feed's: 20 commits with messages"""
+    return {'push_id': i, 'size': 20, 'distinct_size': 20, 'ref': 'refs/heads/main',
+            'commits': [{'sha': f"{i:020d}{c:020d}", 'author': {'email': 'bench@example.com',
+                                                                'name': 'Bench'},
+                         'message': "Refactor the widget pipeline " * 8, 'distinct': True,
+                         'url': f"https://api.github.com/repos/bench/repo/commits/{c}"}
+                        for c in range(20)]}
+
+def make_events(count, start_id):
+    """Events from the last few minutes that never count as activity, so
+    the scan has to walk every one of them"""
+    now = datetime.now(timezone.utc)
+    return [{'id': str(start_id - i), 'type': 'WatchEvent',
+             'actor': {'id': 1, 'login': 'bench'}, 'repo': {'id': 2, 'name': 'bench/repo'},
+             'payload': make_payload(i), 'public': True,
+             'created_at': (now - timedelta(seconds=i)).strftime('%Y-%m-%dT%H:%M:%SZ')}
+            for i in range(count)]
+
+def make_pages(page_count, per_page=100):
+    return [make_events(per_page, 10 ** 9 - page * per_page) for page in range(page_count)]
+
+def history_days(years):
+    """Every other day over the last `years` years, ending yesterday"""
+    yesterday = date.today() - timedelta(days=1)
+    return [yesterday - timedelta(days=i) for i in range(0, years * 365, 2)]
+
+def measure(func, setup=None, repeat=50, memory=False):
+    """Time func(*setup()) repeat times; setup is not timed
+    
+    With memory, one extra untimed run records the peak bytes allocated.
+    """
+    samples = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        started = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - started)
+    result = {}
+    if memory:
+        args = setup() if setup else ()
+        tracemalloc.start()
+        func(*args)
+        result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return dict(result, **{
+        'repeat': repeat,
+        'mean': statistics.fmean(samples),
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'stdev': statistics.stdev(samples) if repeat > 1 else 0.0,
+    })
+
+class Benchmarks:
+    def __init__(self, workdir, repeat):
+        self.workdir = workdir
+        self.repeat = repeat
+        self.count = 0
+
+    def fresh_dir(self):
+        self.count += 1
+        directory = self.workdir / f"run{self.count}"
+        directory.mkdir()
+        return directory
+
+    def profile(self, directory, session=None):
+        return StreakProfile("bench", "token", directory / "streak.json",
+                             directory / "http_cache.json", session=session,
+                             log=lambda message: None)
+
+    def bench_check(self, page_count, seen_after=None):
+        """Check against page_count pages; with seen_after, the cursor says
+        every event after the first seen_after ones was already seen"""
+        pages = make_pages(page_count)
+        profile = self.profile(self.fresh_dir(), FakeSession(pages))
+        cursor = pages[0][seen_after]['id'] if seen_after is not None else None
+
+        def setup():
+            # No validators: every run downloads (and decodes) again
+            profile.http_cache = {profile.events_url(): {'last_event_id': cursor}} if cursor else {}
+            profile.activity.last_event_id = 0
+            return ()
+        return measure(profile.check_github_activity, setup, self.repeat, memory=True)
+
+    def bench_classify(self, count):
+        """Bucket a week's worth of events into local days"""
+        today = date.today()
+        windows = DayWindows(today - timedelta(days=7), today)
+        now = datetime.now(timezone.utc)
+        events = [{'type': 'PushEvent',
+                   'created_at': (now - timedelta(seconds=i * 7 * 86400 // count)).strftime('%Y-%m-%dT%H:%M:%SZ')}
+                  for i in range(count)]
+        return measure(lambda: windows.classify(events), repeat=self.repeat)
+
+    def prepared_history(self, years):
+        """Directory holding a streak.json + history.bin with years of data"""
+        template = self.fresh_dir()
+        profile = self.profile(template)
+        profile.history.update(history_days(years))
+        profile.recompute_stats()
+        profile.save_streak_data()
+        profile.compact_streak_data()
+        return template
+
+    def copy_of(self, template):
+        directory = self.fresh_dir()
+        for path in template.iterdir():
+            shutil.copy(path, directory / path.name)
+        return directory
+
+    def bench_update_streak(self, years):
+        template = self.prepared_history(years)
+
+        def setup():
+            return (self.profile(self.copy_of(template)),)
+        return measure(lambda profile: profile.update_streak(True), setup, self.repeat)
+
+    def bench_load(self, years):
+        template = self.prepared_history(years)
+        return measure(lambda: self.profile(template), repeat=self.repeat)
+
+    def bench_load_legacy(self, years):
+        """Loading (and migrating) an old streak.json with commit_history"""
+        legacy = {'current_streak': 1, 'longest_streak': 1, 'total_days': 0,
+                  'last_commit_date': None,
+                  'commit_history': {day.isoformat(): True for day in history_days(years)}}
+
+        def setup():
+            directory = self.fresh_dir()
+            (directory / "streak.json").write_text(json.dumps(legacy))
+            return (directory,)
+        return measure(self.profile, setup, self.repeat)
+
+    def bench_save(self, years):
+        profile = self.profile(self.copy_of(self.prepared_history(years)))
+
+        def save():
+            profile.streak_data['current_streak'] += 1
+            profile.save_streak_data()
+        return measure(save, repeat=self.repeat)
+
+    def bench_compact(self, years):
+        profile = self.profile(self.copy_of(self.prepared_history(years)))
+
+        def compact():
+            profile.streak_data['current_streak'] += 1
+            profile.save_streak_data()
+            profile.compact_streak_data()
+        return measure(compact, repeat=self.repeat)
+
+    def tracker(self):
+        tracker = StreakTracker(config_dir=self.fresh_dir())
+        tracker.notifications = False
+        return tracker
+
+    def bench_reminder(self):
+        tracker = self.tracker()
+        streaks = itertools.count()
+
+        def setup():
+            tracker.profile.streak_data['current_streak'] = next(streaks) % 400
+            return ()
+        return measure(tracker.get_reminder_message, setup, self.repeat * 20)
+
+    def bench_log_burst(self, lines):
+        tracker = self.tracker()
+
+        def burst():
+            for i in range(lines):
+                tracker.log(f"Burst line {i}")
+        return measure(burst, repeat=max(3, self.repeat // 10))
+
+    def run(self):
+        cases = [
+            ("check_github_activity/100_events", lambda: self.bench_check(1)),
+            ("check_github_activity/3_pages", lambda: self.bench_check(3)),
+            ("check_github_activity/10_pages", lambda: self.bench_check(10)),
+            ("check_github_activity/3_new_events", lambda: self.bench_check(1, seen_after=3)),
+            ("DayWindows.classify/10k_events", lambda: self.bench_classify(10000)),
+        ]
+        for years in (1, 5, 20):
+            cases += [
+                (f"update_streak/{years}y", lambda years=years: self.bench_update_streak(years)),
+                (f"load_streak_data/{years}y", lambda years=years: self.bench_load(years)),
+                (f"load_streak_data_legacy/{years}y", lambda years=years: self.bench_load_legacy(years)),
+                (f"save_streak_data/{years}y", lambda years=years: self.bench_save(years)),
+                (f"compact_streak_data/{years}y", lambda years=years: self.bench_compact(years)),
+            ]
+        cases += [
+            ("get_reminder_message", self.bench_reminder),
+            ("log/burst_1000", lambda: self.bench_log_burst(1000)),
+        ]
+
+        results = {}
+        for name, case in cases:
+            results[name] = case()
+            print(f"{name:<36}{results[name]['median'] * 1e6:12.1f} us", file=sys.stderr)
+        return results
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline_file):
+    with open(baseline_file, 'r') as f:
+        baseline = json.load(f)['results']
+    print(f"\n{'benchmark':<36}{'before':>12}{'after':>12}{'change':>9}", file=sys.stderr)
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]['median'], result['median']
+        print(f"{name:<36}{before * 1e6:10.1f}us{after * 1e6:10.1f}us"
+              f"{(after / before - 1) * 100:+8.1f}%", file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streak hot paths")
+    parser.add_argument("--repeat", type=int, default=50, help="samples per benchmark")
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = Benchmarks(Path(workdir), args.repeat).run()
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'unit': 'seconds',
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
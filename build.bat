@@ -7,7 +7,7 @@ pip install pyinstaller requests plyer
 
 echo.
 echo Building executable...
-pyinstaller --onefile --windowed --name "GitHubStreakTracker" streak_gui.py
+pyinstaller --onefile --windowed --hidden-import requests --add-data "fonts;fonts" --add-data "messages;messages" --name "GitHubStreakTracker" streak_gui.py
 
 echo.
 echo Build complete!
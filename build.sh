@@ -11,15 +11,15 @@ echo "Building executable..."
 
 if [[ "$OSTYPE" == "linux-gnu"* ]]; then
     echo "Building for Linux..."
-    pyinstaller --onefile --windowed --name "GitHubStreakTracker" streak_gui.py
+    pyinstaller --onefile --windowed --hidden-import requests --add-data "fonts:fonts" --add-data "messages:messages" --name "GitHubStreakTracker" streak_gui.py
     
 elif [[ "$OSTYPE" == "darwin"* ]]; then
     echo "Building for macOS..."
-    pyinstaller --onefile --windowed --name "GitHubStreakTracker" streak_gui.py
+    pyinstaller --onefile --windowed --hidden-import requests --add-data "fonts:fonts" --add-data "messages:messages" --name "GitHubStreakTracker" streak_gui.py
     
 elif [[ "$OSTYPE" == "msys" ]] || [[ "$OSTYPE" == "win32" ]]; then
     echo "Building for Windows..."
-    pyinstaller --onefile --windowed --name "GitHubStreakTracker" streak_gui.py
+    pyinstaller --onefile --windowed --hidden-import requests --add-data "fonts:fonts" --add-data "messages:messages" --name "GitHubStreakTracker" streak_gui.py
 fi
 
 echo ""
@@ -0,0 +1,1992 @@
+#!/usr/bin/env python3
+"""Checking, streak and notification core shared by the GUI and headless mode
+
+Nothing here imports Dear PyGui, so the headless entry point starts without
+creating a GUI context.
+"""
+
+import bisect
+import importlib.util
+import json
+import logging
+import logging.handlers
+import os
+import random
+import struct
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import functools
+import heapq
+import itertools
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+def lazy_import(name):
+    """Import a module on first attribute access instead of at startup"""
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# The network stack is only needed once the first check runs
+requests = lazy_import("requests")
+
+# Optional faster JSON backend for the state and config files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# plyer is imported by the first notification; None means not tried yet
+notification = None
+NOTIFICATIONS_AVAILABLE = None
+
+def load_notifier():
+    global notification, NOTIFICATIONS_AVAILABLE
+    if NOTIFICATIONS_AVAILABLE is None:
+        try:
+            from plyer import notification
+            NOTIFICATIONS_AVAILABLE = True
+        except ImportError:
+            NOTIFICATIONS_AVAILABLE = False
+    return NOTIFICATIONS_AVAILABLE
+
+# Event fields the checks read; everything else (notably payload) is dropped
+# except a push's commit count, kept as 'size'
+EVENT_FIELDS = ('id', 'type', 'created_at')
+
+# Event types that count as a contribution for the streak
+ACTIVITY_EVENT_TYPES = ('PushEvent', 'PullRequestEvent', 'IssuesEvent',
+                        'CreateEvent', 'CommitCommentEvent')
+
+# Fields of the per-day activity record, in storage order. Each push adds
+# its commits too; activity types not listed here count as 'other'
+ACTIVITY_FIELDS = ('pushes', 'commits', 'pull_requests', 'issues', 'other')
+EVENT_ACTIVITY_FIELDS = {'PushEvent': 'pushes', 'PullRequestEvent': 'pull_requests',
+                         'IssuesEvent': 'issues'}
+
+GITHUB_API_URL = 'https://api.github.com'
+
+# One contributionsCollection window may span at most a year
+CONTRIBUTIONS_QUERY = """
+query($login: String!, $from: DateTime, $to: DateTime) {
+  user(login: $login) {
+    contributionsCollection(from: $from, to: $to) {
+      contributionYears
+      contributionCalendar {
+        weeks { contributionDays { date contributionCount } }
+      }
+    }
+  }
+}
+"""
+
+# Journal records appended before they are folded into a new snapshot
+JOURNAL_COMPACT_RECORDS = 64
+
+DEFAULT_CHECK_TIMES = ["09:00", "14:00", "20:00"]
+
+# Longest the scheduler sleeps without re-reading the wall clock; the
+# monotonic timer behind Event.wait may not advance while suspended
+SCHEDULER_MAX_SLEEP = 60
+
+# Bounds for the extra polls made while today's activity is still missing
+ADAPTIVE_MIN_POLL = 60
+ADAPTIVE_MAX_POLL = 3600
+# API requests left untouched by adaptive polling (for manual checks)
+RATE_LIMIT_RESERVE = 10
+
+# Attempts per request, and the bounds of the jittered exponential backoff
+# between them; only connection errors and these statuses are retried
+FETCH_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Consecutive failures that open the circuit, and its cooldown bounds
+BREAKER_THRESHOLD = 5
+BREAKER_MIN_COOLDOWN = 30
+BREAKER_MAX_COOLDOWN = 900
+
+# Re-check interval while offline, and how many days a check looks back
+# for activity missed since the last successful one
+OFFLINE_RETRY = 30
+RECOVERY_DAYS = 7
+
+# Activity log: lines kept in memory, rotated file size and backup count
+LOG_CAPACITY = 5000
+LOG_MAX_BYTES = 512 * 1024
+LOG_BACKUPS = 5
+
+# Bundled resources live next to the script (or in the PyInstaller bundle)
+RESOURCE_DIR = Path(getattr(sys, '_MEIPASS', Path(__file__).resolve().parent))
+MESSAGES_DIR = RESOURCE_DIR / "messages"
+
+# Used when no catalog can be found for a mode in any locale
+FALLBACK_MESSAGES = {0: "🔥 Keep your {streak} day streak alive!"}
+
+# Upper bound on concurrent account checks (and pooled connections)
+MAX_CHECK_WORKERS = 32
+
+# Organization/team leaderboard: concurrent member checks, seconds a refresh
+# may keep starting checks, and how often the member list is re-read
+LEADERBOARD_WORKERS = 16
+LEADERBOARD_DEADLINE = 120
+MEMBERS_MAX_AGE = 24 * 3600
+
+# Histogram buckets (seconds) for check timings
+METRICS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Exported metrics: name -> (type, help)
+METRIC_INFO = {
+    'github_streak_checks_total': ('counter', 'Activity checks by outcome'),
+    'github_streak_check_duration_seconds': ('histogram', 'Duration of a whole activity check'),
+    'github_streak_check_phase_seconds': ('histogram', 'Time spent per check phase (request, parse, persist)'),
+    'github_streak_http_responses_total': ('counter', 'GitHub API responses by status code'),
+    'github_streak_rate_limit_remaining': ('gauge', 'Requests left in the current rate-limit window'),
+    'github_streak_current_streak': ('gauge', 'Current streak in days'),
+    'github_streak_longest_streak': ('gauge', 'Longest streak in days'),
+    'github_streak_total_days': ('gauge', 'Days with activity'),
+    'github_streak_seconds_since_last_success': ('gauge', 'Seconds since the last successful check'),
+    'github_streak_leaderboard_members': ('gauge', 'Members on the leaderboard'),
+    'github_streak_leaderboard_refresh_seconds': ('histogram', 'Duration of a leaderboard refresh'),
+}
+
+def create_session():
+    """Create a keep-alive session whose pool can serve every check worker"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CHECK_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+def shared_session():
+    """Process-wide session, created (importing requests) on first use"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit is open"""
+
+class CircuitBreaker:
+    """Fails requests fast after repeated failures of an endpoint
+    
+    BREAKER_THRESHOLD consecutive failures open the circuit. Once the
+    cooldown has passed a single trial request is let through: success
+    closes the circuit, failure reopens it with twice the cooldown (up to
+    BREAKER_MAX_COOLDOWN). Wall-clock time, so a suspend counts.
+    """
+    
+    def __init__(self, threshold=BREAKER_THRESHOLD, min_cooldown=BREAKER_MIN_COOLDOWN,
+                 max_cooldown=BREAKER_MAX_COOLDOWN):
+        self.lock = threading.Lock()
+        self.threshold = threshold
+        self.min_cooldown = min_cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = min_cooldown
+        self.failures = 0
+        self.open_until = None
+        self.trial = False
+    
+    def allow(self):
+        with self.lock:
+            if self.open_until is None:
+                return True
+            if self.trial or time.time() < self.open_until:
+                return False
+            self.trial = True
+            return True
+    
+    def retry_in(self):
+        """Seconds until a request will be let through again"""
+        with self.lock:
+            if self.open_until is None:
+                return 0
+            return max(self.open_until - time.time(), 0)
+    
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.cooldown = self.min_cooldown
+            self.open_until = None
+            self.trial = False
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self.open_until = time.time() + self.cooldown
+                self.trial = False
+            elif self.open_until is None and self.failures >= self.threshold:
+                self.open_until = time.time() + self.cooldown
+
+_circuit_breakers = {}
+
+def circuit_breaker(api_url):
+    """The breaker shared by every account talking to api_url"""
+    with _shared_session_lock:
+        return _circuit_breakers.setdefault(api_url, CircuitBreaker())
+
+def format_age(seconds):
+    if seconds < 90:
+        return f"{int(seconds)}s"
+    if seconds < 90 * 60:
+        return f"{round(seconds / 60)} min"
+    return f"{seconds / 3600:.1f} h"
+
+def atomic_write(path, data):
+    """Write bytes to a temp file, fsync it and rename it over path"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def json_loads(data):
+    """Decode JSON bytes or text, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(data, indent=None):
+    """Encode data as UTF-8 JSON bytes, with orjson when it is installed"""
+    if orjson is not None and indent in (None, 2):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    separators = (',', ':') if indent is None else None
+    return json.dumps(data, indent=indent, separators=separators).encode('utf-8')
+
+def atomic_write_json(path, data, indent=None):
+    atomic_write(path, json_dumps(data, indent))
+
+_json_decoder = json.JSONDecoder()
+_json_whitespace = re.compile(r'[ \t\n\r]*')
+
+def iter_json_array(text):
+    """Yield the items of a JSON array one at a time
+    
+    Each item is decoded only when it is asked for, so a consumer that
+    stops early never decodes the rest, and at most one item is alive.
+    Raises ValueError on malformed (e.g. truncated) input when reached.
+    """
+    skip = _json_whitespace.match
+    idx = skip(text, 0).end()
+    if text[idx:idx + 1] != '[':
+        raise ValueError("expected a JSON array")
+    idx = skip(text, idx + 1).end()
+    if text[idx:idx + 1] == ']':
+        return
+    while True:
+        item, idx = _json_decoder.raw_decode(text, idx)
+        yield item
+        idx = skip(text, idx).end()
+        separator = text[idx:idx + 1]
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError(f"expected ',' or ']' at offset {idx}")
+        idx = skip(text, idx + 1).end()
+
+def decode_events(body):
+    """Yield the events of an events page, keeping only EVENT_FIELDS"""
+    for event in iter_json_array(body.decode('utf-8')):
+        fields = {field: event.get(field) for field in EVENT_FIELDS}
+        if fields['type'] == 'PushEvent':
+            payload = event.get('payload') or {}
+            fields['size'] = payload.get('size', len(payload.get('commits') or ()))
+        yield fields
+
+# GitHub's created_at format: fixed-width UTC, so it sorts chronologically
+GITHUB_TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+@functools.lru_cache(maxsize=1024)
+def local_midnight_utc(ordinal):
+    """Start of the local day with this ordinal, as a GitHub UTC timestamp"""
+    day = date.fromordinal(ordinal)
+    midnight = datetime.combine(day, datetime.min.time()).astimezone()
+    if midnight.date() != day:
+        # Midnight skipped by a DST change: the day starts at the transition
+        midnight = datetime.combine(day, datetime.min.time()).replace(fold=1).astimezone()
+    return midnight.astimezone(timezone.utc).strftime(GITHUB_TIME_FORMAT)
+
+def github_timestamp(value):
+    """Normalize a timestamp that is not already in GITHUB_TIME_FORMAT"""
+    if len(value) == 20 and value.endswith('Z'):
+        return value
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return moment.astimezone(timezone.utc).strftime(GITHUB_TIME_FORMAT)
+
+class DayWindows:
+    """Classifies GitHub timestamps into local days without parsing them
+    
+    The UTC start of each local day from first_day through last_day (DST
+    included) is computed once, cached per day, and kept as a sorted list
+    of timestamp strings; an event's day is then a bisect of its raw
+    created_at over that list. Events after last_day count for last_day,
+    so a server clock slightly ahead of ours doesn't lose today's events.
+    """
+    
+    def __init__(self, first_day, last_day):
+        self.first_ordinal = first_day.toordinal()
+        self.last_ordinal = last_day.toordinal()
+        self.starts = [local_midnight_utc(ordinal)
+                       for ordinal in range(self.first_ordinal, self.last_ordinal + 1)]
+    
+    @property
+    def start(self):
+        """UTC timestamp at which the window opens"""
+        return self.starts[0]
+    
+    def classify(self, events):
+        """Count activity per day: {day ordinal: [count per ACTIVITY_FIELDS]}
+        
+        Only days with activity get an entry.
+        """
+        starts = self.starts
+        first_ordinal = self.first_ordinal
+        pushes = ACTIVITY_FIELDS.index('pushes')
+        commits = ACTIVITY_FIELDS.index('commits')
+        fields = {event_type: ACTIVITY_FIELDS.index(EVENT_ACTIVITY_FIELDS.get(event_type, 'other'))
+                  for event_type in ACTIVITY_EVENT_TYPES}
+        counts = {}
+        for event in events:
+            field = fields.get(event['type'])
+            if field is None:
+                continue
+            i = bisect.bisect_right(starts, github_timestamp(event['created_at'])) - 1
+            if i < 0:
+                continue
+            day = counts.get(first_ordinal + i)
+            if day is None:
+                day = counts[first_ordinal + i] = [0] * len(ACTIVITY_FIELDS)
+            day[field] += 1
+            if field == pushes:
+                day[commits] += event.get('size') or 0
+        return counts
+
+class Metrics:
+    """Counters, gauges and histograms rendered in Prometheus text format
+    
+    Series are keyed by metric name and a sorted tuple of label pairs.
+    Cheap enough to update on every check whether or not anything scrapes.
+    """
+    
+    def __init__(self, buckets=METRICS_BUCKETS):
+        self.lock = threading.Lock()
+        self.buckets = buckets
+        self.values = {}
+        # (name, labels) -> [count per bucket..., +Inf count, sum]
+        self.histograms = {}
+        self.last_success = {}
+    
+    @staticmethod
+    def key(name, labels):
+        return name, tuple(sorted(labels.items()))
+    
+    def inc(self, name, labels, amount=1):
+        key = self.key(name, labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def set(self, name, labels, value):
+        with self.lock:
+            self.values[self.key(name, labels)] = value
+    
+    def observe(self, name, labels, value):
+        key = self.key(name, labels)
+        with self.lock:
+            counts = self.histograms.get(key)
+            if counts is None:
+                counts = self.histograms[key] = [0] * (len(self.buckets) + 2)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            counts[-1] += value
+    
+    def mark_success(self, account):
+        with self.lock:
+            self.last_success[account] = time.time()
+    
+    @staticmethod
+    def series(name, labels, value):
+        label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+        return f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}"
+    
+    def render(self):
+        now = time.time()
+        with self.lock:
+            values = dict(self.values)
+            histograms = {key: list(counts) for key, counts in self.histograms.items()}
+            for account, when in self.last_success.items():
+                values[self.key('github_streak_seconds_since_last_success',
+                                {'account': account})] = round(now - when, 3)
+        
+        by_name = {}
+        for (name, labels), value in values.items():
+            by_name.setdefault(name, []).append(self.series(name, labels, value))
+        for (name, labels), counts in histograms.items():
+            lines = by_name.setdefault(name, [])
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                lines.append(self.series(f"{name}_bucket", labels + (('le', bound),), cumulative))
+            lines.append(self.series(f"{name}_sum", labels, round(counts[-1], 6)))
+            lines.append(self.series(f"{name}_count", labels, cumulative))
+        
+        output = []
+        for name in sorted(by_name):
+            kind, description = METRIC_INFO.get(name, ('untyped', name))
+            output.append(f"# HELP {name} {description}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(by_name[name])
+        return "\n".join(output) + "\n"
+
+# Process-wide metrics shared by every profile
+METRICS = Metrics()
+
+def start_metrics_server(port, metrics=METRICS):
+    """Serve metrics.render() at http://127.0.0.1:<port>/metrics from a thread"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+class StateJournal:
+    """JSON snapshot plus an append-only journal of changed fields
+    
+    Each record holds the new values of the fields that changed, so
+    replaying them is idempotent and a torn final write loses only that
+    record. The journal is folded into the snapshot every
+    JOURNAL_COMPACT_RECORDS records; view, if given, maps the state to what
+    the snapshot file holds.
+    """
+    
+    def __init__(self, snapshot_file, view=None):
+        self.snapshot_file = snapshot_file
+        self.journal_file = snapshot_file.with_suffix(".journal")
+        self.view = view
+        self.records = 0
+    
+    def load(self):
+        """Return the snapshot with the journal replayed on top, or None"""
+        if not self.snapshot_file.exists() and not self.journal_file.exists():
+            return None
+        
+        state = {}
+        if self.snapshot_file.exists():
+            with open(self.snapshot_file, 'rb') as f:
+                state = json_loads(f.read())
+        
+        torn = False
+        if self.journal_file.exists():
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        state.update(json_loads(line))
+                    except ValueError:
+                        torn = True
+                        break
+                    self.records += 1
+        
+        # Never append after a torn record: fold what survived into a snapshot
+        if torn:
+            self.compact(state)
+        return state
+    
+    def append(self, changes, state):
+        if self.records >= JOURNAL_COMPACT_RECORDS:
+            self.compact(state)
+            return
+        with open(self.journal_file, 'ab') as f:
+            f.write(json_dumps(changes) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.records += 1
+    
+    def compact(self, state):
+        # Snapshot first: if we crash before truncating, replaying the
+        # (absolute-valued) records on top of it is harmless
+        atomic_write_json(self.snapshot_file, self.view(state) if self.view else state, indent=2)
+        if self.journal_file.exists():
+            with open(self.journal_file, 'wb'):
+                pass
+        self.records = 0
+
+class DayBitmap:
+    """Set of active days stored as one bit per day ordinal
+    
+    The file is a small header (magic, first ordinal) followed by the raw
+    bits, so ten years of history take well under a kilobyte and queries
+    run as big-integer bit operations instead of walking date strings.
+    With no path the set is only kept in memory.
+    """
+    MAGIC = b'GSB1'
+    HEADER = struct.Struct('<4sI')
+    
+    def __init__(self, path):
+        self.path = path
+        self.base = 0
+        self.bits = bytearray()
+        if path is not None and path.exists():
+            data = path.read_bytes()
+            magic, self.base = self.HEADER.unpack_from(data)
+            if magic != self.MAGIC:
+                raise ValueError(f"{path} is not a streak history file")
+            self.bits = bytearray(data[self.HEADER.size:])
+    
+    def __contains__(self, day):
+        i = day.toordinal() - self.base
+        return 0 <= i < len(self.bits) * 8 and bool(self.bits[i >> 3] & (1 << (i & 7)))
+    
+    def __len__(self):
+        return bin(self.as_int()).count('1')
+    
+    def __iter__(self):
+        """Yield active days in ascending order"""
+        for byte_index, byte in enumerate(self.bits):
+            if byte:
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        yield date.fromordinal(self.base + byte_index * 8 + bit)
+    
+    def as_int(self):
+        return int.from_bytes(self.bits, 'little')
+    
+    def set_bit(self, day):
+        """Set the bit for day in memory
+        
+        Returns the index of the first byte that changed, -1 if the header
+        changed too, or None if the day was already set.
+        """
+        if day in self:
+            return None
+        ordinal = day.toordinal()
+        dirty = None
+        if not self.bits:
+            self.base = ordinal
+            dirty = -1
+        elif ordinal < self.base:
+            # Prepend whole bytes so existing bits keep their positions
+            shift = (self.base - ordinal + 7) // 8
+            self.bits[:0] = bytes(shift)
+            self.base -= shift * 8
+            dirty = -1
+        i = ordinal - self.base
+        if i >> 3 >= len(self.bits):
+            self.bits.extend(bytes((i >> 3) + 1 - len(self.bits)))
+        self.bits[i >> 3] |= 1 << (i & 7)
+        return i >> 3 if dirty is None else dirty
+    
+    def add(self, day):
+        """Mark day as active, writing only the bytes that changed"""
+        dirty = self.set_bit(day)
+        if dirty is None:
+            return False
+        if self.path is None:
+            return True
+        if dirty < 0 or not self.path.exists():
+            self.save()
+        else:
+            with open(self.path, 'r+b') as f:
+                f.seek(self.HEADER.size + dirty)
+                f.write(self.bits[dirty:])
+        return True
+    
+    def update(self, days):
+        """Mark many days as active with a single write; returns how many were new"""
+        added = sum(1 for day in days if self.set_bit(day) is not None)
+        if added and self.path is not None:
+            self.save()
+        return added
+    
+    def save(self):
+        atomic_write(self.path, self.HEADER.pack(self.MAGIC, self.base) + bytes(self.bits))
+    
+    def last_day(self):
+        n = self.as_int()
+        return date.fromordinal(self.base + n.bit_length() - 1) if n else None
+    
+    def run_ending(self, day):
+        """Length of the run of consecutive active days ending on day"""
+        if day not in self:
+            return 0
+        i = day.toordinal() - self.base
+        gaps = ~self.as_int() & ((1 << (i + 1)) - 1)
+        return i + 1 if not gaps else i - (gaps.bit_length() - 1)
+    
+    def longest_run(self):
+        # Each AND with the shifted value shortens every run by one day
+        n = self.as_int()
+        longest = 0
+        while n:
+            n &= n >> 1
+            longest += 1
+        return longest
+
+class ActivityCounts:
+    """Per-day activity counts stored as fixed-width records
+    
+    The file is a header (magic, first ordinal, id of the newest event
+    counted) followed by one record of ACTIVITY_FIELDS per day, so a day's
+    counts sit at a computable offset and a check rewrites only the
+    records it touched. The stored event id makes merging idempotent: a
+    batch of events is never counted twice. With no path the counts are
+    only kept in memory.
+    """
+    MAGIC = b'GSA1'
+    HEADER = struct.Struct('<4sIQ')
+    RECORD = struct.Struct('<' + 'H' * len(ACTIVITY_FIELDS))
+    
+    def __init__(self, path):
+        self.path = path
+        self.base = 0
+        self.last_event_id = 0
+        self.records = bytearray()
+        if path is not None and path.exists():
+            data = path.read_bytes()
+            magic, self.base, self.last_event_id = self.HEADER.unpack_from(data)
+            if magic != self.MAGIC:
+                raise ValueError(f"{path} is not an activity counts file")
+            self.records = bytearray(data[self.HEADER.size:])
+            # A torn final record is dropped
+            del self.records[len(self.records) - len(self.records) % self.RECORD.size:]
+    
+    def get(self, day):
+        """Counts for day, in ACTIVITY_FIELDS order"""
+        i = day.toordinal() - self.base
+        if 0 <= i < len(self.records) // self.RECORD.size:
+            return self.RECORD.unpack_from(self.records, i * self.RECORD.size)
+        return (0,) * len(ACTIVITY_FIELDS)
+    
+    def counts(self, day):
+        return dict(zip(ACTIVITY_FIELDS, self.get(day)))
+    
+    def is_active(self, day):
+        counts = self.counts(day)
+        return any(count for field, count in counts.items() if field != 'commits')
+    
+    def intensity(self, day):
+        """Contributions on day: commits (or pushes, for pushes without
+        commits), pull requests, issues and other activity"""
+        counts = self.counts(day)
+        return (max(counts['pushes'], counts['commits']) + counts['pull_requests']
+                + counts['issues'] + counts['other'])
+    
+    def merge(self, day_counts, last_event_id):
+        """Add {ordinal: counts} for the events up to last_event_id
+        
+        Returns False, changing nothing, if they were already counted.
+        """
+        if not last_event_id or int(last_event_id) <= self.last_event_id:
+            return False
+        size = self.RECORD.size
+        rewrite = self.path is not None and not self.path.exists()
+        dirty = len(self.records)
+        if day_counts:
+            first = min(day_counts)
+            if not self.records:
+                self.base = first
+                rewrite = True
+            elif first < self.base:
+                self.records[:0] = bytes((self.base - first) * size)
+                self.base = first
+                rewrite = True
+            end = (max(day_counts) - self.base + 1) * size
+            if end > len(self.records):
+                self.records.extend(bytes(end - len(self.records)))
+            for ordinal, counts in day_counts.items():
+                offset = (ordinal - self.base) * size
+                record = self.RECORD.unpack_from(self.records, offset)
+                # Saturate rather than wrap around
+                self.RECORD.pack_into(self.records, offset,
+                                      *(min(0xFFFF, old + new) for old, new in zip(record, counts)))
+            dirty = min(dirty, (first - self.base) * size)
+        self.last_event_id = int(last_event_id)
+        if self.path is None:
+            return True
+        
+        header = self.HEADER.pack(self.MAGIC, self.base, self.last_event_id)
+        if rewrite:
+            atomic_write(self.path, header + bytes(self.records))
+        else:
+            with open(self.path, 'r+b') as f:
+                # Header first: a crash in between loses counts instead of
+                # doubling them on the next check
+                f.write(header)
+                f.seek(self.HEADER.size + dirty)
+                f.write(self.records[dirty:])
+        return True
+
+class StreakProfile:
+    """Streak state and GitHub activity checks for a single account"""
+    
+    def __init__(self, username, token, streak_file, cache_file, session=None, log=print,
+                 api_url=GITHUB_API_URL, metrics=METRICS):
+        self.username = username
+        self.token = token
+        self.api_url = api_url
+        self.streak_file = streak_file
+        self.cache_file = cache_file
+        self.session = session
+        self.log = log
+        self.breaker = circuit_breaker(api_url)
+        # Epoch seconds of the first failed request since the last response
+        self.offline_since = None
+        # Called with the days added to the history (None: reload it all);
+        # may be called from worker threads
+        self.day_listeners = []
+        self.metrics = metrics
+        self.labels = {'account': username}
+        # Time spent fetching further event pages during the current check
+        self.paging_seconds = 0.0
+        
+        # Latest rate-limit headers; times are epoch seconds
+        self.rate_limit = {'limit': None, 'remaining': None, 'reset': None,
+                           'poll_interval': None, 'blocked_until': None}
+        
+        self.open_state()
+        self.publish_streak()
+    
+    def open_state(self):
+        """Load the history, counts, streak stats and HTTP cache"""
+        self.history = DayBitmap(self.streak_file.with_name("history.bin"))
+        self.activity = ActivityCounts(self.streak_file.with_name("activity.bin"))
+        self.journal = StateJournal(self.streak_file, view=self.snapshot_view)
+        self.streak_data = self.load_streak_data()
+        # Last state written to disk, used to journal only changed fields
+        self.saved_state = dict(self.streak_data)
+        self.reconcile_stats()
+        self.http_cache = self.load_http_cache()
+
+    def reconcile_stats(self):
+        """Repair stats that lag the history: history.bin is written before
+        the stats, so a crash in between leaves a day without its streak"""
+        last_day = self.history.last_day()
+        if last_day is None:
+            return
+        if (last_day.isoformat() != self.streak_data.get('last_commit_date')
+                or self.streak_data.get('total_days') != len(self.history)):
+            self.recompute_stats()
+            self.save_streak_data()
+
+    def load_streak_data(self):
+        data = self.journal.load()
+        if data is not None:
+            # A legacy file, or the view kept for the CLI. The view records
+            # its own size, so a mismatch means the CLI has rewritten it
+            commit_history = data.pop('commit_history', None)
+            written_days = data.pop('commit_history_days', None)
+            if commit_history is not None and len(commit_history) != written_days:
+                self.history.update(date.fromisoformat(d) for d, active in commit_history.items()
+                                    if active)
+            return data
+        return {
+            'current_streak': 0,
+            'longest_streak': 0,
+            'last_commit_date': None,
+            'total_days': 0
+        }
+    
+    def save_streak_data(self):
+        changes = {key: value for key, value in self.streak_data.items()
+                   if key not in self.saved_state or self.saved_state[key] != value}
+        if changes:
+            self.journal.append(changes, self.streak_data)
+            self.saved_state = dict(self.streak_data)
+            self.publish_streak()
+    
+    def snapshot_view(self, state):
+        """streak.json contents: the state plus the commit_history dict the
+        CLI reads, written only when the journal is compacted"""
+        commit_history = {day.isoformat(): True for day in self.history}
+        return dict(state, commit_history=commit_history, commit_history_days=len(commit_history))
+    
+    def publish_streak(self):
+        """Export the streak stats as gauges"""
+        for key in ('current_streak', 'longest_streak', 'total_days'):
+            self.metrics.set(f'github_streak_{key}', self.labels, self.streak_data[key])
+    
+    def compact_streak_data(self):
+        """Fold the journal into streak.json (e.g. on shutdown, for the CLI)"""
+        if self.journal.records:
+            self.journal.compact(self.streak_data)
+    
+    def load_http_cache(self):
+        """Load cached ETag/Last-Modified validators and parsed events per URL"""
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'rb') as f:
+                    return json_loads(f.read())
+            except (OSError, ValueError):
+                # A corrupt cache only costs one full download
+                pass
+        return {}
+    
+    def save_http_cache(self):
+        atomic_write_json(self.cache_file, self.http_cache)
+    
+    def http(self):
+        """The HTTP session; the shared one unless a session was injected"""
+        if self.session is None:
+            self.session = shared_session()
+        return self.session
+    
+    def request(self, method, url, **kwargs):
+        """Send a request through the circuit breaker
+        
+        Connection errors, timeouts, truncated bodies and 5xx responses are
+        retried with jittered exponential backoff; the last 5xx response is
+        returned. Raises CircuitOpenError without sending anything while the
+        endpoint is considered down.
+        """
+        error = None
+        for attempt in range(FETCH_ATTEMPTS):
+            if attempt:
+                # Full jitter, so accounts failing together retry apart
+                time.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)))
+            if not self.breaker.allow():
+                self.go_offline()
+                raise CircuitOpenError(f"{self.api_url} is unreachable, "
+                                       f"next try in {int(self.breaker.retry_in()) + 1}s")
+            try:
+                response = getattr(self.http(), method)(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                self.breaker.record_failure()
+                error, response = e, None
+                continue
+            except Exception:
+                # Anything else is not retried, but still settles a trial
+                # request; otherwise the circuit would never close again
+                self.breaker.record_failure()
+                raise
+            if response.status_code in RETRY_STATUS_CODES:
+                self.breaker.record_failure()
+                continue
+            self.breaker.record_success()
+            if self.offline_since:
+                self.log(f"✓ Back online after {format_age(time.time() - self.offline_since)}")
+                self.offline_since = None
+            return response
+        
+        self.go_offline()
+        if response is not None:
+            return response
+        raise error
+    
+    def go_offline(self):
+        if not self.offline_since:
+            self.offline_since = time.time()
+    
+    def events_url(self):
+        return f'{self.api_url}/users/{self.username}/events?per_page=100'
+    
+    def cached_verdict(self):
+        """(active, checked_at) of the last successful check today, or None"""
+        cached = self.http_cache.get(self.events_url(), {})
+        if cached.get('date') != datetime.now().date().isoformat():
+            return None
+        return cached.get('active', False), cached.get('checked_at')
+    
+    def record_rate_limit(self, response):
+        """Remember the rate-limit and poll-interval headers of a response"""
+        headers = response.headers
+        self.metrics.inc('github_streak_http_responses_total',
+                         dict(self.labels, code=response.status_code))
+        for key, header in (('limit', 'X-RateLimit-Limit'), ('remaining', 'X-RateLimit-Remaining'),
+                            ('reset', 'X-RateLimit-Reset'), ('poll_interval', 'X-Poll-Interval')):
+            if headers.get(header, '').isdigit():
+                self.rate_limit[key] = int(headers[header])
+        if self.rate_limit['remaining'] is not None:
+            self.metrics.set('github_streak_rate_limit_remaining', self.labels,
+                             self.rate_limit['remaining'])
+        
+        if response.status_code in (403, 429) and (response.status_code == 429
+                                                   or 'Retry-After' in headers
+                                                   or self.rate_limit['remaining'] == 0):
+            retry_after = headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                blocked_until = time.time() + int(retry_after)
+            elif retry_after:
+                blocked_until = parsedate_to_datetime(retry_after).timestamp()
+            else:
+                blocked_until = self.rate_limit['reset'] or time.time() + ADAPTIVE_MIN_POLL
+            self.rate_limit['blocked_until'] = blocked_until
+            return True
+        return False
+    
+    def rate_limit_wait(self):
+        """Seconds until GitHub will accept another request from us"""
+        now = time.time()
+        waits = [0]
+        if self.rate_limit['blocked_until']:
+            waits.append(self.rate_limit['blocked_until'] - now)
+        if self.rate_limit['remaining'] == 0 and self.rate_limit['reset']:
+            waits.append(self.rate_limit['reset'] - now)
+        return max(waits)
+    
+    def check_github_activity(self):
+        """Check today's events; returns True/False, or None on error"""
+        started = time.perf_counter()
+        has_activity = self.fetch_activity()
+        self.metrics.observe('github_streak_check_duration_seconds', self.labels,
+                             time.perf_counter() - started)
+        result = 'error' if has_activity is None else 'active' if has_activity else 'inactive'
+        self.metrics.inc('github_streak_checks_total', dict(self.labels, result=result))
+        if has_activity is not None:
+            self.metrics.mark_success(self.username)
+        return has_activity
+    
+    def observe_phase(self, phase, started):
+        """Record the time since started for a check phase; returns now"""
+        now = time.perf_counter()
+        self.metrics.observe('github_streak_check_phase_seconds',
+                             dict(self.labels, phase=phase), now - started)
+        return now
+    
+    def fetch_activity(self):
+        today = datetime.now().date()
+        
+        wait = self.rate_limit_wait()
+        if wait > 0:
+            self.log(f"Rate limited by GitHub, next request in {int(wait) + 1}s")
+            return None
+        
+        headers = {
+            'Authorization': f'token {self.token}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        
+        url = self.events_url()
+        
+        # Send conditional request headers so an unchanged feed costs a 304,
+        # which GitHub does not count against the rate limit
+        cached = self.http_cache.get(url, {})
+        conditional_headers = dict(headers)
+        if cached.get('etag'):
+            conditional_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            conditional_headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Verdict already established by earlier checks today
+        was_active = cached.get('date') == today.isoformat() and cached.get('active', False)
+        
+        try:
+            started = time.perf_counter()
+            response = self.request('get', url, headers=conditional_headers, timeout=10)
+            started = self.observe_phase('request', started)
+            if self.record_rate_limit(response):
+                self.log(f"Rate limited by GitHub until "
+                         f"{datetime.fromtimestamp(self.rate_limit['blocked_until']):%H:%M:%S}")
+                return None
+            
+            if response.status_code == 304 and cached:
+                # Nothing happened since the last check, so if that check was on
+                # an earlier day there cannot be any activity today either
+                self.http_cache[url] = dict(cached, date=today.isoformat(), active=was_active,
+                                            checked_at=time.time())
+                self.save_http_cache()
+                return was_active
+            
+            response.raise_for_status()
+            # Decoded lazily: a check usually stops at the first few events
+            events = decode_events(response.content)
+            newest = next(events, None)
+            first_page = itertools.chain([newest], events) if newest else ()
+            
+            self.paging_seconds = 0.0
+            # Look back to the day of the last successful check, so activity
+            # after it (late at night, or while offline) still counts for
+            # its own day; the cursor keeps this to the events not seen yet
+            last_checked = date.fromisoformat(cached['date']) if cached.get('date') else today
+            since = min(max(last_checked, today - timedelta(days=RECOVERY_DAYS)), today)
+            windows = DayWindows(since, today)
+            # The counts remember their own cursor, so losing the cache
+            # never counts an event twice
+            last_event_id = max(int(cached.get('last_event_id') or 0), self.activity.last_event_id)
+            new_events = self.iter_new_events(self.iter_events(response, first_page, headers),
+                                              last_event_id, windows.start)
+            day_counts = windows.classify(new_events)
+            active_days = {date.fromordinal(ordinal) for ordinal in day_counts}
+            self.recover_days(active_days - {today})
+            # Further pages were already recorded as requests
+            self.observe_phase('parse', started + self.paging_seconds)
+            
+            started = time.perf_counter()
+            self.activity.merge(day_counts, newest['id'] if newest else None)
+            has_activity = was_active or self.activity.is_active(today)
+            self.http_cache[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'last_event_id': newest['id'] if newest else cached.get('last_event_id'),
+                'date': today.isoformat(),
+                'active': has_activity,
+                'checked_at': time.time()
+            }
+            self.save_http_cache()
+            self.observe_phase('persist', started)
+            
+            return has_activity
+            
+        except (requests.exceptions.RequestException, CircuitOpenError, ValueError) as e:
+            self.log(f"Error checking GitHub: {e}")
+            return None
+    
+    def iter_events(self, response, first_page, headers):
+        """Yield events newest first, fetching further pages only when needed"""
+        page = first_page
+        while True:
+            yield from page
+            next_url = response.links.get('next', {}).get('url')
+            if not next_url:
+                return
+            started = time.perf_counter()
+            response = self.request('get', next_url, headers=headers, timeout=10)
+            self.paging_seconds += self.observe_phase('request', started) - started
+            self.record_rate_limit(response)
+            response.raise_for_status()
+            page = decode_events(response.content)
+    
+    def notify_days(self, days):
+        for listener in self.day_listeners:
+            listener(days)
+    
+    def recover_days(self, days):
+        """Record active days before today that earlier checks missed"""
+        missed = [day for day in days if day not in self.history]
+        if missed:
+            self.history.update(missed)
+            self.recompute_stats()
+            self.save_streak_data()
+            self.notify_days(missed)
+            self.log(f"Recovered {len(missed)} missed day(s) for {self.username}: "
+                     + ", ".join(day.isoformat() for day in sorted(missed)))
+    
+    def iter_new_events(self, events, last_event_id, day_start):
+        """Yield events until one was already seen or predates day_start
+        
+        day_start is a UTC timestamp in GITHUB_TIME_FORMAT.
+        """
+        for event in events:
+            if last_event_id and int(event['id']) <= int(last_event_id):
+                return
+            if github_timestamp(event['created_at']) < day_start:
+                return
+            yield event
+    
+    def day_counts(self, day):
+        """Activity counts recorded for a local day, by ACTIVITY_FIELDS"""
+        return self.activity.counts(day)
+    
+    def average_intensity(self, day, days=7):
+        """Mean daily contributions over the days days ending on day"""
+        return sum(self.activity.intensity(day - timedelta(days=i)) for i in range(days)) / days
+    
+    def update_streak(self, has_activity):
+        started = time.perf_counter()
+        try:
+            return self.apply_verdict(has_activity)
+        finally:
+            self.observe_phase('persist', started)
+    
+    def apply_verdict(self, has_activity):
+        today_date = datetime.now().date()
+        today = today_date.isoformat()
+        yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
+        last_date = self.streak_data['last_commit_date']
+        
+        if has_activity:
+            # Only process if this is the first commit of today
+            if today_date not in self.history:
+                self.history.add(today_date)
+                self.notify_days([today_date])
+                
+                # Increment streak if yesterday was the last commit
+                if last_date == yesterday:
+                    self.streak_data['current_streak'] += 1
+                # Start new streak if no previous commits or gap
+                elif last_date is None:
+                    self.streak_data['current_streak'] = 1
+                else:
+                    # There was a gap - reset streak to 1
+                    self.streak_data['current_streak'] = 1
+                
+                # Update last commit date
+                self.streak_data['last_commit_date'] = today
+                
+                # Update longest streak if needed
+                if self.streak_data['current_streak'] > self.streak_data['longest_streak']:
+                    self.streak_data['longest_streak'] = self.streak_data['current_streak']
+                
+                # Update total days
+                self.streak_data['total_days'] = len(self.history)
+                
+                self.save_streak_data()
+                return True
+            else:
+                # Already committed today - no change needed
+                return True
+        else:
+            # No activity today
+            if last_date == yesterday:
+                # Streak at risk but not broken yet
+                return False
+            elif last_date != today and self.streak_data['current_streak']:
+                # Streak broken - reset to 0
+                self.streak_data['current_streak'] = 0
+                self.save_streak_data()
+            return False
+    
+    def query_contributions(self, start=None, end=None):
+        """Run one contributionsCollection query; defaults to the last year"""
+        variables = {'login': self.username}
+        if start:
+            variables['from'] = start.isoformat()
+        if end:
+            variables['to'] = end.isoformat()
+        response = self.request('post', f'{self.api_url}/graphql',
+                                json={'query': CONTRIBUTIONS_QUERY, 'variables': variables},
+                                headers={'Authorization': f'bearer {self.token}'},
+                                timeout=30)
+        response.raise_for_status()
+        result = response.json()
+        if result.get('errors'):
+            raise ValueError(result['errors'][0].get('message', 'GraphQL error'))
+        return result['data']['user']['contributionsCollection']
+    
+    def backfill_history(self, progress=None):
+        """Merge the full contribution calendar into the history
+        
+        Issues one GraphQL query to discover the contribution years and
+        one per year window, then recomputes the derived stats once.
+        Returns the number of days that were added.
+        """
+        years = sorted(self.query_contributions()['contributionYears'])
+        now = datetime.now().astimezone()
+        active_days = []
+        
+        for i, year in enumerate(years):
+            start = datetime(year, 1, 1, tzinfo=now.tzinfo)
+            end = min(datetime(year, 12, 31, 23, 59, 59, tzinfo=now.tzinfo), now)
+            calendar = self.query_contributions(start, end)['contributionCalendar']
+            for week in calendar['weeks']:
+                for day in week['contributionDays']:
+                    if day['contributionCount'] > 0:
+                        active_days.append(date.fromisoformat(day['date']))
+            if progress:
+                progress(i + 1, len(years))
+        
+        added = self.history.update(active_days)
+        self.recompute_stats()
+        self.save_streak_data()
+        self.notify_days(None)
+        return added
+    
+    def recompute_stats(self):
+        """Derive all streak stats from the history bitmap"""
+        last_day = self.history.last_day()
+        # A run ending yesterday is at risk but still alive
+        alive = last_day is not None and (datetime.now().date() - last_day).days <= 1
+        self.streak_data['current_streak'] = self.history.run_ending(last_day) if alive else 0
+        self.streak_data['longest_streak'] = max(self.history.longest_run(), self.streak_data['longest_streak'])
+        self.streak_data['last_commit_date'] = last_day.isoformat() if last_day else None
+        self.streak_data['total_days'] = len(self.history)
+
+class MemberProfile(StreakProfile):
+    """A leaderboard member: the single-account checks, with the state
+    read from and returned as one leaderboard.json row instead of files
+    
+    Only what the next check needs is kept: the stats, the active days as
+    bitmap bytes, and the feed's validators and cursor. Activity counts
+    live in memory for the duration of a check.
+    """
+    # Row layout in leaderboard.json
+    ROW_FIELDS = ('current_streak', 'longest_streak', 'total_days', 'last_commit_date', 'checked_at',
+                  'history_base', 'history', 'etag', 'last_modified', 'last_event_id', 'date', 'active')
+    
+    def __init__(self, login, row, owner, metrics):
+        self.row = dict(zip(self.ROW_FIELDS, row or ()))
+        super().__init__(login, owner.token, None, None, session=owner.session,
+                         log=lambda message: None, api_url=owner.api_url, metrics=metrics)
+        # One token, one budget
+        self.rate_limit = owner.rate_limit
+    
+    def open_state(self):
+        row = self.row
+        self.history = DayBitmap(None)
+        if row.get('history'):
+            self.history.base = row['history_base']
+            self.history.bits = bytearray.fromhex(row['history'])
+        self.activity = ActivityCounts(None)
+        self.journal = None
+        self.streak_data = {
+            'current_streak': row.get('current_streak', 0),
+            'longest_streak': row.get('longest_streak', 0),
+            'last_commit_date': row.get('last_commit_date'),
+            'total_days': row.get('total_days', 0)
+        }
+        self.saved_state = dict(self.streak_data)
+        cached = {key: row.get(key) for key in ('etag', 'last_modified', 'last_event_id',
+                                                'date', 'active', 'checked_at')}
+        self.http_cache = {self.events_url(): cached} if row.get('date') else {}
+    
+    def save_streak_data(self):
+        pass
+    
+    def save_http_cache(self):
+        pass
+    
+    def compact_streak_data(self):
+        pass
+    
+    def to_row(self):
+        """The state as a leaderboard.json row"""
+        cached = self.http_cache.get(self.events_url(), {})
+        state = dict(self.streak_data, history_base=self.history.base,
+                     history=self.history.bits.hex(), checked_at=int(time.time()),
+                     **{key: cached.get(key) for key in ('etag', 'last_modified', 'last_event_id',
+                                                          'date', 'active')})
+        return [state[field] for field in self.ROW_FIELDS]
+
+class Leaderboard:
+    """Streak standings for every member of an organization or team
+    
+    Members are checked with the same per-account logic as the watched
+    accounts, using the owner profile's token. Member profiles share the
+    owner's rate-limit state, so the whole board spends one budget and
+    stops when it runs low. Each member's whole state is one row in
+    leaderboard.json (see MemberProfile); members get no files of their own.
+    """
+    
+    def __init__(self, owner, target, data_dir, log=print):
+        self.owner = owner
+        # 'org' or 'org/team-slug'
+        self.target = target
+        self.org, _, self.team = target.partition('/')
+        self.state_file = data_dir / "leaderboard.json"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        self.log = log
+        # Per-member check metrics stay out of /metrics
+        self.member_metrics = Metrics()
+        self.labels = {'leaderboard': target}
+        self.lock = threading.Lock()
+        self.refreshing = threading.Lock()
+        # Checks the current refresh may still start; None when unknown
+        self.budget = None
+        # Checks started whose cost is not in the reported remaining yet
+        self.in_flight = 0
+        
+        state = self.load_state()
+        self.members = state.get('members', [])
+        self.members_updated = state.get('members_updated', 0)
+        self.rows = state.get('rows', {})
+    
+    def load_state(self):
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'rb') as f:
+                    return json_loads(f.read())
+            except (OSError, ValueError):
+                # Rebuilt by the next refresh
+                pass
+        return {}
+    
+    def save_state(self):
+        with self.lock:
+            state = {'members': self.members, 'members_updated': self.members_updated,
+                     'rows': dict(self.rows)}
+        atomic_write_json(self.state_file, state)
+    
+    def members_url(self):
+        if self.team:
+            return f'{self.owner.api_url}/orgs/{self.org}/teams/{self.team}/members?per_page=100'
+        return f'{self.owner.api_url}/orgs/{self.org}/members?per_page=100'
+    
+    def api_headers(self):
+        return {
+            'Authorization': f'token {self.owner.token}',
+            'Accept': 'application/vnd.github.v3+json'
+        }
+    
+    def discover_members(self):
+        """Logins of every member, following the Link pagination"""
+        members = []
+        url = self.members_url()
+        while url:
+            response = self.owner.request('get', url, headers=self.api_headers(), timeout=10)
+            self.owner.record_rate_limit(response)
+            response.raise_for_status()
+            members.extend(member['login'] for member in json_loads(response.content))
+            url = response.links.get('next', {}).get('url')
+        return members
+    
+    def learn_rate_limit(self):
+        """Read the remaining budget from GET /rate_limit, which is free"""
+        try:
+            response = self.owner.request('get', f'{self.owner.api_url}/rate_limit',
+                                          headers=self.api_headers(), timeout=10)
+            self.owner.record_rate_limit(response)
+            response.raise_for_status()
+            core = json_loads(response.content)['resources']['core']
+        except (requests.exceptions.RequestException, CircuitOpenError,
+                ValueError, KeyError, TypeError) as e:
+            self.log(f"⚠️ Could not read the rate limit: {e}")
+            return
+        for key in ('limit', 'remaining', 'reset'):
+            if self.owner.rate_limit[key] is None and isinstance(core.get(key), int):
+                self.owner.rate_limit[key] = core[key]
+    
+    def take_budget(self):
+        """Reserve the API budget for one member check; False once it is spent
+        
+        Checks still in flight have not been subtracted from the remaining
+        count GitHub reports yet, so they are counted against it here.
+        """
+        with self.lock:
+            remaining = self.owner.rate_limit['remaining']
+            if (self.owner.rate_limit_wait() > 0 or remaining is not None
+                    and remaining - self.in_flight <= RATE_LIMIT_RESERVE):
+                return False
+            if self.budget is not None:
+                if self.budget <= 0:
+                    return False
+                self.budget -= 1
+            self.in_flight += 1
+            return True
+    
+    def check_member(self, login, deadline):
+        """Check one member: 'active', 'inactive', 'failed' or 'deferred'"""
+        with self.lock:
+            row = self.rows.get(login)
+        try:
+            profile = MemberProfile(login, row, self.owner, self.member_metrics)
+        except (ValueError, TypeError) as e:
+            self.log(f"⚠️ Leaderboard: dropping the unreadable state of {login}: {e}")
+            profile = MemberProfile(login, None, self.owner, self.member_metrics)
+        
+        if time.monotonic() > deadline or not self.take_budget():
+            return 'deferred'
+        secured = datetime.now().date() in profile.history
+        try:
+            has_activity = profile.check_github_activity()
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        if has_activity is None:
+            return 'failed'
+        if secured:
+            has_activity = True
+        else:
+            profile.update_streak(has_activity)
+        
+        with self.lock:
+            self.rows[login] = profile.to_row()
+        return 'active' if has_activity else 'inactive'
+    
+    def refresh(self, deadline=LEADERBOARD_DEADLINE):
+        """Check the members, least recently checked first
+        
+        Stops starting checks after deadline seconds or when the rate-limit
+        budget is spent; members left over go first next time. Returns the
+        standings, or None if another refresh is already running.
+        """
+        if not self.refreshing.acquire(blocking=False):
+            return None
+        try:
+            started = time.monotonic()
+            if not self.members or time.time() - self.members_updated > MEMBERS_MAX_AGE:
+                try:
+                    members = self.discover_members()
+                except (requests.exceptions.RequestException, CircuitOpenError,
+                        ValueError, KeyError, TypeError) as e:
+                    self.log(f"⚠️ Could not list the members of {self.target}: {e}")
+                    members = None
+                if members is not None:
+                    current = set(members)
+                    with self.lock:
+                        self.members = members
+                        self.members_updated = int(time.time())
+                        self.rows = {login: row for login, row in self.rows.items() if login in current}
+            
+            if self.owner.rate_limit['remaining'] is None:
+                self.learn_rate_limit()
+            remaining = self.owner.rate_limit['remaining']
+            self.budget = remaining - RATE_LIMIT_RESERVE if remaining is not None else None
+            checked_at = MemberProfile.ROW_FIELDS.index('checked_at')
+            order = sorted(self.members, key=lambda login: self.rows[login][checked_at]
+                           if login in self.rows else 0)
+            
+            stop_at = started + deadline
+            outcomes = []
+            if order and remaining is None:
+                # Still no budget known: let one check report it before fanning out
+                outcomes.append(self.check_member(order[0], stop_at))
+            with ThreadPoolExecutor(max_workers=LEADERBOARD_WORKERS) as pool:
+                outcomes += pool.map(lambda login: self.check_member(login, stop_at),
+                                     order[len(outcomes):])
+            self.save_state()
+            
+            elapsed = time.monotonic() - started
+            METRICS.set('github_streak_leaderboard_members', self.labels, len(order))
+            METRICS.observe('github_streak_leaderboard_refresh_seconds', self.labels, elapsed)
+            checked = outcomes.count('active') + outcomes.count('inactive')
+            message = f"Leaderboard {self.target}: checked {checked}/{len(order)} members"
+            for outcome in ('deferred', 'failed'):
+                if outcomes.count(outcome):
+                    message += f", {outcomes.count(outcome)} {outcome}"
+            self.log(f"{message} in {elapsed:.1f}s")
+            return self.standings()
+        finally:
+            self.refreshing.release()
+    
+    def standings(self):
+        """(login, current, longest, total) per member, best current streak first"""
+        with self.lock:
+            rows = [(login, row[0], row[1], row[2]) for login, row in self.rows.items()]
+        return sorted(rows, key=lambda row: (-row[1], -row[2], row[0].lower()))
+
+def parse_check_times(text):
+    """Parse 'HH:MM, HH:MM' into sorted, de-duplicated 'HH:MM' strings"""
+    check_times = set()
+    for part in text.replace(';', ',').split(','):
+        part = part.strip()
+        if part:
+            check_times.add(datetime.strptime(part, "%H:%M").strftime("%H:%M"))
+    if not check_times:
+        raise ValueError("at least one check time is required")
+    return sorted(check_times)
+
+def next_poll_delay(now, rate_limit):
+    """Seconds until the next extra poll on a day with no activity yet
+    
+    Polls get more frequent as midnight approaches but never faster than
+    the server's X-Poll-Interval or than the remaining API budget can
+    sustain until the rate-limit window resets.
+    """
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    seconds_left = (midnight - now).total_seconds()
+    delay = min(max(seconds_left / 12, ADAPTIVE_MIN_POLL), ADAPTIVE_MAX_POLL)
+    
+    if rate_limit['poll_interval']:
+        delay = max(delay, rate_limit['poll_interval'])
+    if rate_limit['remaining'] is not None and rate_limit['reset']:
+        until_reset = max(rate_limit['reset'] - now.timestamp(), 0)
+        spare = rate_limit['remaining'] - RATE_LIMIT_RESERVE
+        delay = max(delay, until_reset if spare <= 0 else until_reset / spare)
+    if rate_limit['blocked_until']:
+        delay = max(delay, rate_limit['blocked_until'] - now.timestamp())
+    return delay
+
+def format_check_time(check_time):
+    hour, minute = map(int, check_time.split(':'))
+    return f"{hour % 12 or 12}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+class CheckScheduler:
+    """Calls a function at daily wall-clock check slots
+    
+    Next fire times live in a heap and the worker blocks on an Event until
+    the earliest one, so stop() and reschedule() take effect immediately.
+    Slots missed while the machine slept are coalesced into a single
+    catch-up call. Besides the slots, a single extra poll can be armed
+    with poll_at(); it runs poll_callback instead.
+    """
+    
+    def __init__(self, check_times, callback, poll_callback=None):
+        self.callback = callback
+        self.poll_callback = poll_callback or callback
+        self.poll_time = None
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.heap = []
+        self.thread = None
+        self.reschedule(check_times)
+    
+    def next_fire_time(self, check_time, after):
+        hour, minute = map(int, check_time.split(':'))
+        fire_time = after.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if fire_time <= after:
+            fire_time += timedelta(days=1)
+        return fire_time
+    
+    def reschedule(self, check_times):
+        now = datetime.now()
+        with self.lock:
+            self.heap = [(self.next_fire_time(t, now), t) for t in check_times]
+            heapq.heapify(self.heap)
+        self.wakeup.set()
+    
+    def poll_at(self, when):
+        """Arm (or with None, cancel) the extra poll"""
+        with self.lock:
+            self.poll_time = when
+        self.wakeup.set()
+    
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        self.stopped.set()
+        self.wakeup.set()
+    
+    def pop_due(self, now):
+        """Advance every slot that is due; returns True if any was"""
+        due = False
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                _, check_time = heapq.heappop(self.heap)
+                heapq.heappush(self.heap, (self.next_fire_time(check_time, now), check_time))
+                due = True
+        return due
+    
+    def pop_poll(self, now):
+        with self.lock:
+            due = self.poll_time is not None and self.poll_time <= now
+            if due:
+                self.poll_time = None
+        return due
+    
+    def run(self):
+        while not self.stopped.is_set():
+            now = datetime.now()
+            if self.pop_due(now):
+                self.callback()
+                continue
+            if self.pop_poll(now):
+                self.poll_callback()
+                continue
+            
+            with self.lock:
+                fire_times = [t for t in (self.heap[0][0] if self.heap else None, self.poll_time) if t]
+            timeout = (min(fire_times) - now).total_seconds() if fire_times else None
+            if timeout is None or timeout > SCHEDULER_MAX_SLEEP:
+                timeout = SCHEDULER_MAX_SLEEP
+            self.wakeup.wait(timeout)
+            self.wakeup.clear()
+
+class ActivityLog:
+    """Bounded activity log backed by size-rotated files
+    
+    The newest LOG_CAPACITY lines are kept in a ring buffer (restored from
+    disk on startup); every line is also appended to activity.log, which
+    rotates through LOG_BACKUPS older files.
+    """
+    
+    def __init__(self, log_file, capacity=LOG_CAPACITY):
+        self.lock = threading.Lock()
+        self.lines = deque(self.read_tail(log_file, capacity), maxlen=capacity)
+        
+        self.logger = logging.getLogger(f"github_streak.activity.{log_file}")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        if not self.logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            self.logger.addHandler(handler)
+    
+    @staticmethod
+    def read_tail(log_file, count):
+        """Read the newest count lines, walking backups only as far as needed"""
+        chunks = []
+        total = 0
+        for i in range(LOG_BACKUPS + 1):
+            path = log_file if i == 0 else log_file.with_name(f"{log_file.name}.{i}")
+            if total >= count or not path.exists():
+                break
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                chunk = f.read().splitlines()
+            chunks.append(chunk)
+            total += len(chunk)
+        lines = [line for chunk in reversed(chunks) for line in chunk]
+        return lines[-count:]
+    
+    def append(self, line):
+        with self.lock:
+            self.lines.append(line)
+        self.logger.info(line)
+    
+    def search(self, text=""):
+        """Lines containing text (case-insensitive), oldest first"""
+        with self.lock:
+            lines = list(self.lines)
+        if not text:
+            return lines
+        text = text.lower()
+        return [line for line in lines if text in line.lower()]
+
+
+class MessageCatalog:
+    """Reminder messages keyed by the streak length they start at
+    
+    Thresholds are kept sorted so lookup is a bisect; streaks below the
+    first threshold get the first message. "{streak}" in a message is
+    replaced with the streak length.
+    """
+    
+    def __init__(self, messages):
+        thresholds = sorted(messages)
+        self.thresholds = thresholds
+        self.messages = [messages[t] for t in thresholds]
+    
+    def lookup(self, streak):
+        i = max(bisect.bisect_right(self.thresholds, streak) - 1, 0)
+        return self.messages[i].replace("{streak}", str(streak))
+
+def read_messages(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return {int(threshold): message for threshold, message in json.load(f).items()}
+
+@functools.lru_cache(maxsize=None)
+def load_message_catalog(mode, locale, user_dir):
+    """Build the catalog for a mode and locale on first use
+    
+    The bundled messages/<mode>.<locale>.json falls back to English, and a
+    user pack of the same name in user_dir adds or replaces thresholds.
+    """
+    messages = {}
+    for name in (f"{mode}.en.json", f"{mode}.{locale}.json"):
+        for directory in (MESSAGES_DIR, user_dir):
+            path = directory / name
+            if path.exists():
+                try:
+                    messages.update(read_messages(path))
+                except (OSError, ValueError, AttributeError):
+                    pass
+    return MessageCatalog(messages or FALLBACK_MESSAGES)
+
+class StreakTracker:
+    """Config, accounts, checks and notifications for every front end
+    
+    The GUI subclasses this and overrides the on_* hooks to update its
+    views; headless mode uses it as is. Hooks may be called from worker
+    threads.
+    """
+    
+    def __init__(self, config_dir=None, echo=False):
+        self.config_dir = config_dir or Path.home() / ".github_streak"
+        self.config_file = self.config_dir / "config.json"
+        self.streak_file = self.config_dir / "streak.json"
+        self.cache_file = self.config_dir / "http_cache.json"
+        self.accounts_dir = self.config_dir / "accounts"
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.username = ""
+        self.token = ""
+        self.reminder_mode = "normal"
+        self.locale = "en"
+        self.auto_start = True
+        # Additional accounts watched alongside the primary one:
+        # list of {'username': ..., 'token': ...}
+        self.extra_accounts = []
+        self.check_times = list(DEFAULT_CHECK_TIMES)
+        # Localhost port for the Prometheus endpoint; None disables it
+        self.metrics_port = None
+        self.metrics_server = None
+        # GitHub API base URL (e.g. tools/fake_github_api.py for testing)
+        self.api_url = GITHUB_API_URL
+        # Years of history shown by the dashboard heatmap
+        self.heatmap_years = 1
+        # Organization ('org') or team ('org/team-slug') to rank; "" for none
+        self.leaderboard_target = ""
+        
+        self.is_running = False
+        self.scheduler = None
+        self.notifications = True
+        # Also print log lines to stderr (headless mode)
+        self.echo = echo
+        
+        self.activity_log = ActivityLog(self.config_dir / "activity.log")
+        self.load_config()
+        self.load_profiles()
+    
+    def log(self, message):
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        line = f"[{timestamp}] {message}"
+        self.activity_log.append(line)
+        if self.echo:
+            print(line, file=sys.stderr, flush=True)
+    
+    def load_config(self):
+        if self.config_file.exists():
+            with open(self.config_file, 'rb') as f:
+                config = json_loads(f.read())
+                self.username = config.get('username', '')
+                self.token = config.get('token', '')
+                self.reminder_mode = config.get('reminder_mode', 'normal')
+                self.locale = config.get('locale', 'en')
+                self.auto_start = config.get('auto_start', True)
+                self.extra_accounts = config.get('extra_accounts', [])
+                self.check_times = config.get('check_times', list(DEFAULT_CHECK_TIMES))
+                self.metrics_port = config.get('metrics_port')
+                self.api_url = config.get('api_url', GITHUB_API_URL).rstrip('/')
+                self.heatmap_years = config.get('heatmap_years', 1)
+                self.leaderboard_target = config.get('leaderboard', '')
+    
+    def save_config(self):
+        config = {
+            'username': self.username,
+            'token': self.token,
+            'reminder_mode': self.reminder_mode,
+            'locale': self.locale,
+            'auto_start': self.auto_start,
+            'extra_accounts': self.extra_accounts,
+            'check_times': self.check_times,
+            'metrics_port': self.metrics_port,
+            'api_url': self.api_url,
+            'heatmap_years': self.heatmap_years,
+            'leaderboard': self.leaderboard_target
+        }
+        atomic_write_json(self.config_file, config, indent=2)
+    
+    def load_profiles(self):
+        """(Re)create the primary profile and one profile per extra account"""
+        # The primary account keeps the top-level files shared with the CLI
+        self.profile = StreakProfile(self.username, self.token, self.streak_file,
+                                     self.cache_file, log=self.log, api_url=self.api_url)
+        self.extra_profiles = []
+        for account in self.extra_accounts:
+            account_dir = self.accounts_dir / account['username']
+            account_dir.mkdir(parents=True, exist_ok=True)
+            self.extra_profiles.append(StreakProfile(
+                account['username'], account.get('token') or self.token,
+                account_dir / "streak.json", account_dir / "http_cache.json",
+                log=self.log, api_url=self.api_url))
+        self.leaderboard = None
+        if self.leaderboard_target:
+            self.leaderboard = Leaderboard(self.profile, self.leaderboard_target,
+                                           self.config_dir / "leaderboard", log=self.log)
+    
+    def start_metrics(self, port=None):
+        """Serve /metrics on localhost if a port is given or configured"""
+        port = port or self.metrics_port
+        if not port or self.metrics_server:
+            return
+        try:
+            self.metrics_server = start_metrics_server(port)
+            self.log(f"Metrics at http://127.0.0.1:{port}/metrics")
+        except OSError as e:
+            self.log(f"⚠️ Could not serve metrics on port {port}: {e}")
+    
+    def parse_extra_accounts(self, text):
+        """Parse 'username' or 'username:token' lines from the settings box"""
+        accounts = []
+        for line in text.splitlines():
+            username, _, token = line.strip().partition(':')
+            username = username.strip()
+            if username and username != self.username:
+                accounts.append({'username': username, 'token': token.strip()})
+        return accounts
+    
+    def send_notification(self, title, message):
+        if self.notifications and load_notifier():
+            try:
+                notification.notify(
+                    title=title,
+                    message=message,
+                    app_name='GitHub Streak',
+                    timeout=10
+                )
+            except Exception as e:
+                # plyer raises NotImplementedError, OSError, dbus errors...
+                self.log(f"⚠️ Notification failed: {e}")
+    
+    def get_reminder_message(self):
+        catalog = load_message_catalog(self.reminder_mode, self.locale, self.config_dir / "messages")
+        return catalog.lookup(self.profile.streak_data['current_streak'])
+    
+    def manual_check(self, remind=True):
+        """Check every account; returns the results in profile order"""
+        self.log("Running manual check..." if remind else "Polling GitHub...")
+        
+        if not self.extra_profiles:
+            results = [self.check_primary_profile(remind)]
+        else:
+            # Check every account at once so a round costs the slowest
+            # request, not the sum of all of them
+            workers = min(MAX_CHECK_WORKERS, len(self.extra_profiles) + 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                primary = pool.submit(self.check_primary_profile, remind)
+                extra = list(pool.map(self.check_profile, self.extra_profiles))
+                results = [primary.result()] + extra
+            
+            active = sum(1 for result in extra if result)
+            failed = sum(1 for result in extra if result is None)
+            self.log(f"Other accounts: {active}/{len(extra)} active today"
+                     + (f", {failed} failed" if failed else ""))
+        
+        self.on_checks_finished()
+        self.schedule_adaptive_poll()
+        
+        # Polls between the scheduled slots only watch our own accounts
+        if remind and self.leaderboard:
+            self.refresh_leaderboard()
+        return results
+    
+    def refresh_leaderboard(self):
+        if self.leaderboard.refresh() is not None:
+            self.on_leaderboard_updated()
+    
+    def poll_check(self):
+        """Extra check between slots: only notifies when activity shows up"""
+        self.manual_check(remind=False)
+    
+    def schedule_adaptive_poll(self):
+        """Arm the next extra poll, or cancel it once today is secured"""
+        scheduler = self.scheduler
+        if not scheduler:
+            return
+        now = datetime.now()
+        if now.date() in self.profile.history:
+            scheduler.poll_at(None)
+            return
+        profiles = [self.profile] + self.extra_profiles
+        # Stay inside the tightest budget among the watched accounts
+        delay = max(next_poll_delay(now, profile.rate_limit) for profile in profiles)
+        offline = [profile for profile in profiles if profile.offline_since]
+        if offline:
+            # Re-check as soon as the circuit lets a trial request through
+            delay = min(delay, max([OFFLINE_RETRY] + [profile.breaker.retry_in() for profile in offline]))
+        scheduler.poll_at(now + timedelta(seconds=delay))
+    
+    def check_profile(self, profile):
+        """Check one account and record activity; returns None on error"""
+        secured = datetime.now().date() in profile.history
+        # Still fetched once secured, to keep today's counts growing
+        has_activity = profile.check_github_activity()
+        if secured:
+            return True
+        if has_activity:
+            profile.update_streak(True)
+        return has_activity
+    
+    def check_primary_profile(self, remind=True):
+        """Check the primary account, logging and notifying the outcome
+        
+        Returns True when today is covered, None on error.
+        """
+        secured = datetime.now().date() in self.profile.history
+        # Still fetched once secured (a 304 is free) to merge today's counts
+        has_activity = self.profile.check_github_activity()
+        if secured:
+            self.log("✓ Already committed today!")
+            self.on_primary_checked('secured')
+            return True
+        
+        
+        if has_activity is None:
+            if self.profile.offline_since:
+                self.log(f"📴 Offline - {self.offline_summary()}")
+                self.on_primary_checked('offline')
+            else:
+                self.log("⚠️ Could not check GitHub")
+                self.on_primary_checked('error')
+            return None
+        
+        if has_activity:
+            self.profile.update_streak(True)
+            self.log(f"✓ Activity detected! Streak: {self.profile.streak_data['current_streak']} days")
+            self.on_primary_checked('active')
+            self.send_notification("GitHub Streak", 
+                                  f"Activity detected! {self.profile.streak_data['current_streak']} days 🔥")
+        else:
+            reminder = self.get_reminder_message()
+            self.log(f"⚠️ NO ACTIVITY TODAY - {reminder}")
+            self.on_primary_checked('inactive')
+            if remind:
+                self.send_notification("GitHub Streak Reminder", reminder)
+        return has_activity
+    
+    def offline_summary(self):
+        """The last verdict served while offline, with its age"""
+        verdict = self.profile.cached_verdict()
+        if verdict is None:
+            return "no result from today yet"
+        active, checked_at = verdict
+        age = format_age(time.time() - checked_at) if checked_at else "a while"
+        return f"{'activity' if active else 'no activity'} as of {age} ago"
+    
+    def start_monitoring(self):
+        if self.is_running:
+            return
+        
+        self.is_running = True
+        
+        self.on_monitoring_changed(True)
+        
+        self.log("Monitoring started")
+        self.log("Checks at: " + ", ".join(format_check_time(t) for t in self.check_times))
+        
+        self.scheduler = CheckScheduler(self.check_times, self.manual_check, self.poll_check)
+        self.scheduler.start()
+        
+        threading.Thread(target=self.manual_check, daemon=True).start()
+    
+    def stop_monitoring(self):
+        self.is_running = False
+        if self.scheduler:
+            self.scheduler.stop()
+            self.scheduler = None
+        
+        self.on_monitoring_changed(False)
+        
+        self.log("⏸ Monitoring stopped")
+    
+    def shutdown(self):
+        """Stop the scheduler and fold every journal into its snapshot"""
+        self.is_running = False
+        if self.scheduler:
+            self.scheduler.stop()
+        for profile in [self.profile] + self.extra_profiles:
+            profile.compact_streak_data()
+        if self.metrics_server:
+            self.metrics_server.shutdown()
+            self.metrics_server = None
+    
+    def on_primary_checked(self, state):
+        """Primary check outcome: 'secured', 'active', 'inactive', 'offline' or 'error'"""
+    
+    def on_checks_finished(self):
+        """A check round is done and the stats may have changed"""
+    
+    def on_monitoring_changed(self, running):
+        """Monitoring was started or stopped"""
+    
+    def on_leaderboard_updated(self):
+        """A leaderboard refresh finished"""
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Run the streak checks without a GUI
+
+    --once    check every account, print a JSON report and exit
+    --daemon  run the scheduled checks until interrupted
+
+Uses the same ~/.github_streak config and data as the GUI, so the two can be
+run alternately (one at a time).
+"""
+
+import argparse
+import json
+import signal
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from streak_core import StreakTracker
+
+def account_report(profile, result):
+    data = profile.streak_data
+    verdict = profile.cached_verdict()
+    today = datetime.now().date()
+    checked_at = verdict[1] if verdict else None
+    return {
+        'username': profile.username,
+        'active_today': result,
+        'current_streak': data['current_streak'],
+        'longest_streak': data['longest_streak'],
+        'total_days': data['total_days'],
+        'last_commit_date': data['last_commit_date'],
+        'rate_limit_remaining': profile.rate_limit['remaining'],
+        'activity_today': profile.day_counts(today),
+        'intensity_today': profile.activity.intensity(today),
+        'intensity_7d': round(profile.average_intensity(today), 2),
+        'offline': bool(profile.offline_since),
+        'last_checked': datetime.fromtimestamp(checked_at).isoformat(timespec='seconds')
+                        if checked_at else None,
+    }
+
+def run_once(tracker):
+    """Exit status is 0 when the primary account was checked, 1 on error"""
+    results = tracker.manual_check()
+    tracker.shutdown()
+    report = {
+        'checked_at': datetime.now().isoformat(timespec='seconds'),
+        'accounts': [account_report(profile, result) for profile, result
+                     in zip([tracker.profile] + tracker.extra_profiles, results)],
+    }
+    if tracker.leaderboard:
+        report['leaderboard'] = [
+            {'rank': rank, 'username': login, 'current_streak': current,
+             'longest_streak': longest, 'total_days': total}
+            for rank, (login, current, longest, total)
+            in enumerate(tracker.leaderboard.standings(), 1)]
+    print(json.dumps(report, indent=2))
+    return 0 if results[0] is not None else 1
+
+def run_daemon(tracker):
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+
+    tracker.start_monitoring()
+    try:
+        # Short waits keep Ctrl+C responsive on every platform
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    tracker.stop_monitoring()
+    tracker.shutdown()
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="GitHub Streak Tracker (headless)")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--once", action="store_true",
+                      help="check once, print a JSON report and exit")
+    mode.add_argument("--daemon", action="store_true",
+                      help="run the scheduled checks until interrupted")
+    parser.add_argument("--no-notify", action="store_true",
+                        help="do not send desktop notifications")
+    parser.add_argument("--metrics-port", type=int,
+                        help="serve Prometheus metrics on this localhost port "
+                             "(default: metrics_port from config.json)")
+    parser.add_argument("--config-dir", type=Path,
+                        help="data directory to use instead of ~/.github_streak")
+    parser.add_argument("--api-url",
+                        help="GitHub API base URL (default: api_url from config.json)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="also print the activity log to stderr")
+    args = parser.parse_args()
+
+    tracker = StreakTracker(args.config_dir, echo=args.verbose or args.daemon)
+    tracker.notifications = not args.no_notify
+    if args.api_url:
+        tracker.api_url = args.api_url.rstrip('/')
+        tracker.load_profiles()
+    if not tracker.username or not tracker.token:
+        print("Not configured: set a username and token in the GUI first", file=sys.stderr)
+        return 1
+    if args.daemon:
+        tracker.start_metrics(args.metrics_port)
+
+    return run_once(tracker) if args.once else run_daemon(tracker)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""Stand-in for the parts of the GitHub API the tracker uses
+
+Serves generated (or recorded) /users/<user>/events pages, paginated
+/orgs/<org>/members and /orgs/<org>/teams/<team>/members lists, a free
+/rate_limit and a minimal /graphql contributions endpoint with GitHub-like ETag,
+Last-Modified, Link and rate-limit headers, and can inject latency and
+faults:
+
+    python3 tools/fake_github_api.py --port 8765 --latency 0.2 --fault-rate 0.1
+
+then point the app at it with "api_url": "http://127.0.0.1:8765" in
+~/.github_streak/config.json, or streak_headless.py --api-url. Any username
+works; each gets its own deterministic event feed. Every org (and team) has
+--org-size members named <org>-member-<n>. GET /_stats returns the
+responses served so far.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+ACTIVITY_TYPES = ['PushEvent', 'PullRequestEvent', 'IssuesEvent', 'CreateEvent',
+                  'CommitCommentEvent']
+PASSIVE_TYPES = ['WatchEvent', 'ForkEvent', 'PublicEvent', 'MemberEvent']
+FAULTS = ['304', '403', '429', '500', '502', '503', 'truncate']
+
+def github_time(moment):
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+class EventFeeds:
+    """Per-user event lists, newest first
+
+    Feeds are generated from a seed derived from the username: `history`
+    events spaced `spacing` seconds apart going back from server start, and
+    one more event every `new_event_every` seconds after it. Users drawn as
+    inactive have no activity-type events today.
+    """
+
+    def __init__(self, history, spacing, new_event_every, active_ratio, recorded=None):
+        self.history = history
+        self.spacing = spacing
+        self.new_event_every = new_event_every
+        self.active_ratio = active_ratio
+        self.recorded = recorded
+        self.started = datetime.now(timezone.utc)
+        self.lock = threading.Lock()
+        self.feeds = {}
+
+    def make_event(self, rng, username, event_id, created, active):
+        today = datetime.now().astimezone().date()
+        local_day = created.astimezone().date()
+        event_type = rng.choice(ACTIVITY_TYPES + PASSIVE_TYPES
+                                if active or local_day != today else PASSIVE_TYPES)
+        payload = {}
+        if event_type == 'PushEvent':
+            size = rng.randint(1, 5)
+            payload = {'size': size, 'distinct_size': size,
+                       'commits': [{'sha': f"{rng.getrandbits(160):040x}", 'message': 'Update'}
+                                   for _ in range(size)]}
+        elif event_type in ('PullRequestEvent', 'IssuesEvent'):
+            payload = {'action': rng.choice(['opened', 'closed']), 'number': rng.randint(1, 999)}
+        return {
+            'id': str(event_id),
+            'type': event_type,
+            'actor': {'id': rng.randint(1, 10 ** 7), 'login': username},
+            'repo': {'id': rng.randint(1, 10 ** 8), 'name': f"{username}/project-{rng.randint(1, 20)}"},
+            'payload': payload,
+            'public': True,
+            'created_at': github_time(created),
+        }
+
+    def events(self, username):
+        if self.recorded is not None:
+            return self.recorded
+        now = datetime.now(timezone.utc)
+        with self.lock:
+            feed = self.feeds.get(username)
+            if feed is None:
+                seed = int.from_bytes(hashlib.sha256(username.encode()).digest()[:8], 'big')
+                rng = random.Random(seed)
+                active = rng.random() < self.active_ratio
+                base_id = 10 ** 10 + seed % 10 ** 9
+                feed = {'rng': rng, 'active': active, 'next_id': base_id + 1, 'added': 0,
+                        'events': [self.make_event(rng, username, base_id - i,
+                                                   self.started - timedelta(seconds=i * self.spacing),
+                                                   active)
+                                   for i in range(self.history)]}
+                self.feeds[username] = feed
+            # Live events since the server started
+            if self.new_event_every:
+                due = int((now - self.started).total_seconds() / self.new_event_every)
+                while feed['added'] < due:
+                    feed['added'] += 1
+                    created = self.started + timedelta(seconds=feed['added'] * self.new_event_every)
+                    feed['events'].insert(0, self.make_event(feed['rng'], username, feed['next_id'],
+                                                             created, feed['active']))
+                    feed['next_id'] += 1
+            # GitHub keeps at most 300 events / 90 days per feed
+            del feed['events'][300:]
+            return list(feed['events'])
+
+    def active_days(self, username, year):
+        """Deterministic contribution calendar for /graphql"""
+        rng = random.Random(f"{username}:{year}")
+        day = datetime(year, 1, 1).date()
+        today = datetime.now().date()
+        days = []
+        while day.year == year and day <= today:
+            days.append((day.isoformat(), rng.choice([0, 0, 1, 2, 5])))
+            day += timedelta(days=1)
+        return days
+
+class RateLimiter:
+    """GitHub-style fixed window per token (or per client without one)"""
+
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.windows = {}
+
+    def take(self, key, cost=1):
+        """Returns (allowed, limit, remaining, reset)"""
+        now = time.time()
+        with self.lock:
+            used, reset = self.windows.get(key, (0, now + self.window))
+            if now >= reset:
+                used, reset = 0, now + self.window
+            allowed = used + cost <= self.limit
+            if allowed:
+                used += cost
+            self.windows[key] = (used, reset)
+        return allowed, self.limit, self.limit - used, int(reset)
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    # Set on the class by make_server
+    options = None
+    feeds = None
+    limiter = None
+    stats = None
+    stats_lock = None
+    rng = None
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.options.verbose:
+            super().log_message(format, *args)
+
+    def count(self, status):
+        with self.stats_lock:
+            self.stats[str(status)] += 1
+
+    def pick_fault(self):
+        with self.stats_lock:
+            if self.rng.random() >= self.options.fault_rate:
+                return None
+            return self.rng.choice(self.options.faults)
+
+    def delay(self):
+        latency = self.options.latency
+        if self.options.jitter:
+            with self.stats_lock:
+                latency += self.rng.uniform(0, self.options.jitter)
+        if latency > 0:
+            time.sleep(latency)
+
+    def send_json(self, status, data, headers=(), truncate=False):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if truncate:
+            # Promise the whole body, send half of it and hang up
+            self.wfile.write(body[:len(body) // 2])
+            self.close_connection = True
+        else:
+            self.wfile.write(body)
+        self.count('truncated' if truncate else status)
+
+    def send_empty(self, status, headers=()):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.count(status)
+
+    def rate_headers(self, limit, remaining, reset):
+        return [('X-RateLimit-Limit', str(limit)), ('X-RateLimit-Remaining', str(remaining)),
+                ('X-RateLimit-Reset', str(reset)), ('X-RateLimit-Used', str(limit - remaining)),
+                ('X-RateLimit-Resource', 'core')]
+
+    def client_key(self):
+        return self.headers.get('Authorization') or self.client_address[0]
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/_stats':
+            with self.stats_lock:
+                stats = dict(self.stats)
+            self.send_json(200, stats)
+            return
+        if url.path == '/rate_limit':
+            self.serve_rate_limit()
+            return
+        parts = url.path.strip('/').split('/')
+        if parts[0] == 'orgs' and parts[-1] == 'members' and len(parts) in (3, 5):
+            self.delay()
+            self.serve_members(url.path, parts[1], parse_qs(url.query))
+            return
+        if len(parts) != 3 or parts[0] != 'users' or parts[2] != 'events':
+            self.send_json(404, {'message': 'Not Found'})
+            return
+        self.delay()
+        self.serve_events(parts[1], parse_qs(url.query))
+
+    def page_links(self, path, per_page, page, last_page):
+        base = f"http://{self.headers.get('Host', 'localhost')}{path}"
+        links = []
+        if page < last_page:
+            links.append(f'<{base}?per_page={per_page}&page={page + 1}>; rel="next"')
+            links.append(f'<{base}?per_page={per_page}&page={last_page}>; rel="last"')
+        if page > 1:
+            links.append(f'<{base}?per_page={per_page}&page=1>; rel="first"')
+            links.append(f'<{base}?per_page={per_page}&page={page - 1}>; rel="prev"')
+        return [('Link', ', '.join(links))] if links else []
+
+    def serve_rate_limit(self):
+        # Like GitHub, asking for the rate limit does not count against it
+        _, limit, remaining, reset = self.limiter.take(self.client_key(), cost=0)
+        core = {'limit': limit, 'remaining': remaining, 'reset': reset, 'used': limit - remaining}
+        self.send_json(200, {'resources': {'core': core}, 'rate': core},
+                       self.rate_headers(limit, remaining, reset))
+
+    def serve_members(self, path, org, query):
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        page = max(int(query.get('page', ['1'])[0]), 1)
+        size = self.options.org_size
+        members = [{'login': f"{org}-member-{i:04d}", 'id': i, 'type': 'User'}
+                   for i in range((page - 1) * per_page, min(page * per_page, size))]
+        allowed, limit, remaining, reset = self.limiter.take(self.client_key())
+        if not allowed:
+            self.send_json(403, {'message': 'API rate limit exceeded'},
+                           self.rate_headers(limit, 0, reset))
+            return
+        last_page = max((size + per_page - 1) // per_page, 1)
+        self.send_json(200, members, self.rate_headers(limit, remaining, reset)
+                       + self.page_links(path, per_page, page, last_page))
+
+    def serve_events(self, username, query):
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+        page = max(int(query.get('page', ['1'])[0]), 1)
+        events = self.feeds.events(username)
+        page_events = events[(page - 1) * per_page:page * per_page]
+        body = json.dumps(page_events).encode('utf-8')
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        newest = events[0]['created_at'] if events else github_time(self.feeds.started)
+        last_modified = formatdate(datetime.fromisoformat(newest.replace('Z', '+00:00')).timestamp(),
+                                   usegmt=True)
+
+        fault = self.pick_fault()
+        key = self.client_key()
+        not_modified = fault == '304' or self.headers.get('If-None-Match') == etag
+        # Like GitHub, a 304 for a conditional request is free
+        allowed, limit, remaining, reset = self.limiter.take(key, cost=0 if not_modified else 1)
+        rate_headers = self.rate_headers(limit, remaining, reset)
+
+        if fault == '403':
+            self.send_json(403, {'message': 'You have exceeded a secondary rate limit.'},
+                           rate_headers + [('Retry-After', str(self.options.retry_after))])
+            return
+        if fault == '429':
+            self.send_json(429, {'message': 'Too Many Requests'},
+                           rate_headers + [('Retry-After', str(self.options.retry_after))])
+            return
+        if fault in ('500', '502', '503'):
+            self.send_json(int(fault), {'message': 'Server Error'}, rate_headers)
+            return
+        if not allowed:
+            self.send_json(403, {'message': 'API rate limit exceeded'},
+                           self.rate_headers(limit, 0, reset))
+            return
+
+        headers = rate_headers + [('ETag', etag), ('Last-Modified', last_modified),
+                                  ('X-Poll-Interval', str(self.options.poll_interval)),
+                                  ('Cache-Control', 'private, max-age=60, s-maxage=60')]
+        if not_modified:
+            self.send_empty(304, headers)
+            return
+
+        last_page = max((len(events) + per_page - 1) // per_page, 1)
+        headers += self.page_links(f"/users/{username}/events", per_page, page, last_page)
+        self.send_json(200, page_events, headers, truncate=fault == 'truncate')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length) or b'{}')
+        if urlsplit(self.path).path != '/graphql':
+            self.send_json(404, {'message': 'Not Found'})
+            return
+        self.delay()
+        variables = request.get('variables', {})
+        username = variables.get('login', '')
+        this_year = datetime.now().year
+        year = int(variables['from'][:4]) if variables.get('from') else this_year
+        days = self.feeds.active_days(username, year)
+        weeks = [{'contributionDays': [{'date': d, 'contributionCount': c} for d, c in days[i:i + 7]]}
+                 for i in range(0, len(days), 7)]
+        self.send_json(200, {'data': {'user': {'contributionsCollection': {
+            'contributionYears': list(range(this_year, this_year - self.options.years, -1)),
+            'contributionCalendar': {'weeks': weeks},
+        }}}})
+
+def make_server(options):
+    recorded = None
+    if options.events_file:
+        with open(options.events_file, 'r') as f:
+            recorded = json.load(f)
+
+    class Handler(FakeGitHubHandler):
+        pass
+    Handler.options = options
+    Handler.feeds = EventFeeds(options.history, options.spacing, options.new_event_every,
+                               options.active_ratio, recorded)
+    Handler.limiter = RateLimiter(options.rate_limit, options.rate_window)
+    Handler.stats = Counter()
+    Handler.stats_lock = threading.Lock()
+    Handler.rng = random.Random(options.seed)
+
+    server = ThreadingHTTPServer((options.host, options.port), Handler)
+    server.daemon_threads = True
+    return server
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fake GitHub API for offline load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds added to every API response")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="extra random latency, up to this many seconds")
+    parser.add_argument("--fault-rate", type=float, default=0.0,
+                        help="fraction of event requests that get a fault")
+    parser.add_argument("--faults", type=lambda text: text.split(','), default=FAULTS,
+                        help="comma-separated faults to pick from: " + ",".join(FAULTS))
+    parser.add_argument("--retry-after", type=int, default=60,
+                        help="Retry-After seconds sent with 403/429 faults")
+    parser.add_argument("--rate-limit", type=int, default=5000,
+                        help="requests per window and token")
+    parser.add_argument("--rate-window", type=int, default=3600)
+    parser.add_argument("--poll-interval", type=int, default=60,
+                        help="X-Poll-Interval header value")
+    parser.add_argument("--history", type=int, default=120,
+                        help="generated events per user at startup")
+    parser.add_argument("--spacing", type=int, default=900,
+                        help="seconds between generated events")
+    parser.add_argument("--new-event-every", type=float, default=0,
+                        help="add an event to every feed this often (0: never)")
+    parser.add_argument("--active-ratio", type=float, default=0.5,
+                        help="fraction of users with activity today")
+    parser.add_argument("--org-size", type=int, default=50,
+                        help="members listed for every org and team")
+    parser.add_argument("--years", type=int, default=3,
+                        help="contribution years reported by /graphql")
+    parser.add_argument("--events-file",
+                        help="serve this recorded JSON list of events to every user")
+    parser.add_argument("--seed", type=int, default=0, help="seed for fault injection")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    options = parser.parse_args(argv)
+    unknown = set(options.faults) - set(FAULTS)
+    if unknown:
+        parser.error(f"unknown faults: {', '.join(sorted(unknown))}")
+    return options
+
+def main():
+    options = parse_args()
+    server = make_server(options)
+    print(f"Fake GitHub API at http://{options.host}:{options.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    server.server_close()
+    print(json.dumps(dict(server.RequestHandlerClass.stats), indent=2))
+
+if __name__ == "__main__":
+    main()